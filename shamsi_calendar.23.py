@@ -7,6 +7,7 @@ import os
 import tkinter.filedialog as filedialog
 import tkinter.colorchooser as colorchooser
 import re
+from functools import lru_cache
 
 try:
     import jdatetime
@@ -19,70 +20,249 @@ except ImportError:
     )
     sys.exit(1)
 
+from utils_numba import days_in_jmonth, year_layout
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON helpers working on bytes; orjson is used when available
+if orjson is not None:
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_line(obj):
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def _dumps_line(obj):
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+    _loads = json.loads
+
 # Constants
 EVENTS_FILE = "events.json"
 SETTINGS_FILE = "settings.json"
+EVENTS_LOG_FILE = "events.log"
+EVENTS_FORMAT_VERSION = 2
+REDRAW_DELAY_MS = 80
+FLUSH_DELAY_MS = 2000
+DEFAULT_DAY_COLOR = '#cccccc'
+_SHADES = (
+    "#cce5ff", "#99ccff", "#66b3ff", "#3399ff", "#1a8cff",
+    "#0073e6", "#0059b3", "#004080", "#00264d", "#001a33"
+)
+_PRI_TO_STR = {1: "High", 2: "Medium", 3: "Low"}
+_STR_TO_PRI = {"High": 1, "Medium": 2, "Low": 3}
+_TIME_RE = re.compile(r'^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$')
 events = {}
+events_log = None
+events_file_unreadable = False  # set when events.json fails to load, so it is never overwritten
+pending_redraw = None
+pending_flush = None
+dirty_keys = set()  # days changed but not yet written to the events log
+last_saved_settings = (None, None)
+
+def _day_meta_entry(day_events):
+    event_count = len(day_events)
+    # Only the first event's colour matters; fall back to a count-based shade
+    first_color = day_events[0][1]
+    bg_color = first_color if first_color != DEFAULT_DAY_COLOR else _SHADES[min(event_count, 10) - 1]
+    tooltip_text = "\n".join(map(format_event, day_events))
+    return (event_count, bg_color, tooltip_text)
+
+_NO_EVENTS_META = (0, DEFAULT_DAY_COLOR, "No events")
+
+class DayMeta(dict):
+    """(y, m, d) -> (event_count, bg_color, tooltip_text), computed the first time a day is drawn."""
+    def __missing__(self, key):
+        day_events = events.get(key)
+        entry = self[key] = _day_meta_entry(day_events) if day_events else _NO_EVENTS_META
+        return entry
+
+day_meta = DayMeta()
+
+def invalidate_day_meta():
+    """Drop all cached rendering data; days are recomputed as they are drawn."""
+    day_meta.clear()
+
+def invalidate_day(key):
+    """Drop the rendering data of a single day after its events changed."""
+    day_meta.pop(key, None)
+
+def events_to_json(evs):
+    """Serialize events as a list of [year, month, day, events] records."""
+    return {"version": EVENTS_FORMAT_VERSION, "records": [[y, m, d, v] for (y, m, d), v in evs.items() if v]}
+
+def events_from_json(raw):
+    """Build an events dict from records, or from legacy "y-m-d" string keys."""
+    if "version" not in raw:
+        return {tuple(map(int, k.split("-"))): v for k, v in raw.items()}
+    if raw["version"] != EVENTS_FORMAT_VERSION:
+        raise ValueError(f"unsupported events file version {raw['version']!r}")
+    return {(r[0], r[1], r[2]): r[3] for r in raw["records"]}
 
 def load_events():
-    global events
+    global events, events_file_unreadable
+    migrate = False
     if os.path.exists(EVENTS_FILE):
         try:
-            with open(EVENTS_FILE, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-                events = {tuple(map(int, k.split("-"))): v for k, v in raw.items()}
-        except (IOError, json.JSONDecodeError) as e:
-            messagebox.showerror("Error", f"Failed to load events: {e}")
+            with open(EVENTS_FILE, "rb") as f:
+                raw = _loads(f.read())
+                events = events_from_json(raw)
+                migrate = "version" not in raw
+        except (IOError, ValueError) as e:
+            events_file_unreadable = True
+            messagebox.showerror("Error", f"Failed to load events: {e}\n{EVENTS_FILE} will not be overwritten.")
+    # Replay changes made since the last compaction
+    if os.path.exists(EVENTS_LOG_FILE):
+        good_size = 0
+        line = b"\n"
+        try:
+            with open(EVENTS_LOG_FILE, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        y, m, d, v = _loads(line)
+                        events[(y, m, d)] = v
+                    good_size += len(line)
+            if not line.endswith(b"\n"):
+                # Terminate a record cut short by a crash so the next append starts a new line
+                with open(EVENTS_LOG_FILE, "ab") as f:
+                    f.write(b"\n")
+        except (IOError, ValueError, TypeError) as e:
+            messagebox.showerror("Error", f"Failed to replay events log: {e}")
+            # Drop the damaged tail so new records are not appended onto it
+            try:
+                os.truncate(EVENTS_LOG_FILE, good_size)
+            except OSError:
+                pass
+    if migrate:
+        compact_events()
+    invalidate_day_meta()
+
+def open_events_log():
+    global events_log
+    try:
+        events_log = open(EVENTS_LOG_FILE, "ab")
+    except IOError as e:
+        messagebox.showerror("Error", f"Failed to open events log: {e}")
+
+def save_events_incremental(key):
+    """Append the new state of a single day to the events log."""
+    invalidate_day(key)
+    write_events_log([key])
+
+def write_events_log(keys):
+    if events_log is None:
+        compact_events()
+        return
+    try:
+        for key in keys:
+            events_log.write(_dumps_line([*key, events.get(key, [])]))
+        events_log.flush()
+    except IOError as e:
+        messagebox.showerror("Error", f"Failed to save events: {e}")
+
+def mark_dirty(key):
+    """Queue a day for saving; bursts of changes are written once FLUSH_DELAY_MS later."""
+    global pending_flush
+    invalidate_day(key)
+    dirty_keys.add(key)
+    if pending_flush is not None:
+        root.after_cancel(pending_flush)
+    pending_flush = root.after(FLUSH_DELAY_MS, flush_dirty)
+
+def flush_dirty():
+    global pending_flush
+    pending_flush = None
+    keys = list(dirty_keys)
+    dirty_keys.clear()
+    write_events_log(keys)
 
 def save_events():
+    invalidate_day_meta()
+    compact_events()
+
+def write_atomic(path, data):
+    """Write bytes to path through a temp file so a crash never leaves it half-written."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def compact_events():
+    """Rewrite events.json atomically and empty the events log."""
+    if events_file_unreadable:
+        # Never overwrite an events.json we failed to read; keep every change in the log instead
+        if events_log is not None:
+            write_events_log(list(events))
+            dirty_keys.clear()
+        else:
+            messagebox.showerror("Error", f"Events not saved: {EVENTS_FILE} could not be read and is left untouched.")
+        return
     try:
-        with open(EVENTS_FILE, "w", encoding="utf-8") as f:
-            json.dump({"-".join(map(str, k)): v for k, v in events.items()}, f, indent=2, ensure_ascii=False)
+        write_atomic(EVENTS_FILE, _dumps(events_to_json(events)))
+        dirty_keys.clear()
+        if events_log is not None:
+            events_log.seek(0)
+            events_log.truncate()
     except IOError as e:
         messagebox.showerror("Error", f"Failed to save events: {e}")
 
+def on_close():
+    if dirty_keys or (events_log is not None and events_log.tell() and not events_file_unreadable):
+        compact_events()
+    if events_log is not None:
+        events_log.close()
+    root.destroy()
+
 def load_settings():
+    global last_saved_settings
     if os.path.exists(SETTINGS_FILE):
         try:
             with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
                 data = json.load(f)
-                return data.get("last_year"), data.get("last_month")
+                last_saved_settings = (data.get("last_year"), data.get("last_month"))
+                return last_saved_settings
         except (IOError, json.JSONDecodeError) as e:
             messagebox.showerror("Error", f"Failed to load settings: {e}")
     return None, None
 
 def save_settings(year, month):
+    global last_saved_settings
+    if (year, month) == last_saved_settings:
+        return
     try:
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-            json.dump({"last_year": year, "last_month": month}, f)
+        write_atomic(SETTINGS_FILE, json.dumps({"last_year": year, "last_month": month}).encode("utf-8"))
+        last_saved_settings = (year, month)
     except IOError as e:
         messagebox.showerror("Error", f"Failed to save settings: {e}")
 
-def get_event_color(event_count, event_color=None):
-    default_color = '#cccccc'
-    shades = [
-        "#cce5ff", "#99ccff", "#66b3ff", "#3399ff", "#1a8cff",
-        "#0073e6", "#0059b3", "#004080", "#00264d", "#001a33"
-    ]
-    index = min(event_count, 10) - 1
-    return event_color or shades[index] if event_count > 0 else default_color
-
 def validate_time(time_str):
     """Validate time format (HH:MM, 24-hour)."""
     if not time_str:
         return True  # Allow empty time
-    pattern = r'^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$'
-    return bool(re.match(pattern, time_str))
+    return _TIME_RE.match(time_str) is not None
 
 def priority_to_str(priority):
     """Convert priority integer to string."""
-    return {1: "High", 2: "Medium", 3: "Low"}.get(priority, "Unknown")
+    return _PRI_TO_STR.get(priority, "Unknown")
 
 def str_to_priority(priority_str):
     """Convert priority string to integer."""
-    return {"High": 1, "Medium": 2, "Low": 3}.get(priority_str, 2)
+    return _STR_TO_PRI.get(priority_str, 2)
+
+def format_event(e):
+    """One-line summary of an event, as shown in tooltips and the day page."""
+    return f"{e[0]} (Time: {e[2] or 'N/A'}, Priority: {_PRI_TO_STR.get(e[3], 'Unknown')})"
 
 today_jdate = jdatetime.date.today()
+today_key = (today_jdate.year, today_jdate.month, today_jdate.day)
 
 def add_event(year, month, day):
     key = (year, month, day)
@@ -97,7 +277,7 @@ def add_event(year, month, day):
             return
         color_code = colorchooser.askcolor(title="Pick a color")[1]
         events.setdefault(key, []).append((event, color_code, time or "", priority))
-        save_events()
+        save_events_incremental(key)
         set_calendar()
         messagebox.showinfo("Success", "Event added.")
 
@@ -110,8 +290,11 @@ def view_events(year, month, day):
     else:
         messagebox.showinfo("No Events", f"No events for {day}/{month}/{year}.")
 
-def edit_event_panel(year, month, day, idx):
-    """Open a panel to edit all event details at once."""
+def edit_event_panel(year, month, day, idx, on_change=None):
+    """Open a panel to edit all event details at once.
+
+    on_change is called after the event is saved or deleted.
+    """
     key = (year, month, day)
     day_events = events.get(key, [])
     if not day_events or idx < 0 or idx >= len(day_events):
@@ -167,18 +350,22 @@ def edit_event_panel(year, month, day, idx):
             return
 
         day_events[idx] = (new_text, new_color, new_time or "", new_priority)
-        save_events()
+        save_events_incremental(key)
         set_calendar()
         edit_window.destroy()
+        if on_change:
+            on_change()
         messagebox.showinfo("Success", "Event updated.")
 
     def delete_event():
         choice = messagebox.askyesno("Delete Event", "Are you sure you want to delete this event?")
         if choice:
             day_events.pop(idx)
-            save_events()
+            save_events_incremental(key)
             set_calendar()
             edit_window.destroy()
+            if on_change:
+                on_change()
             messagebox.showinfo("Deleted", "Event deleted.")
 
     # Buttons
@@ -190,24 +377,26 @@ def edit_event_panel(year, month, day, idx):
 
     edit_window.protocol("WM_DELETE_WINDOW", edit_window.destroy)
 
-def edit_events(year, month, day):
+def edit_events(year, month, day, on_change=None):
     key = (year, month, day)
     day_events = events.get(key, [])
     if not day_events:
         messagebox.showinfo("No Events", "No events to edit.")
         return
-    list_text = "\n".join(f"{i+1}: {e[0]} (Time: {e[2] or 'N/A'}, Priority: {priority_to_str(e[3])})" for i, e in enumerate(day_events))
+    list_text = "\n".join(f"{i+1}: {format_event(e)}" for i, e in enumerate(day_events))
     selected = simpledialog.askinteger("Edit Event", f"Select event index to edit:\n{list_text}")
     if selected is None or not (1 <= selected <= len(day_events)):
         return
     idx = selected - 1
-    edit_event_panel(year, month, day, idx)
+    edit_event_panel(year, month, day, idx, on_change)
 
 def delete_all_events():
-    if events:
+    if any(events.values()):
         choice = messagebox.askyesno("Delete All Events", "Are you sure you want to delete all events?")
         if choice:
-            events.clear()
+            # Empty the lists in place; open day pages hold references to them
+            for day_events in events.values():
+                day_events.clear()
             save_events()
             set_calendar()
             messagebox.showinfo("Success", "All events have been deleted.")
@@ -217,120 +406,157 @@ def delete_all_events():
 def on_day_click(year, month, day):
     view_day_page(year, month, day)
 
-def is_leap_year(year):
-    try:
-        jdatetime.date(year, 12, 30)
-        return True
-    except ValueError:
-        return False
-
 def get_days_in_month(year, month):
-    return 31 if month <= 6 else 30 if month <= 11 else (30 if is_leap_year(year) else 29)
+    return days_in_jmonth(year, month)
+
+@lru_cache(maxsize=256)
+def _day_cells(year, month, miladi_format):
+    """(key, button label) of each day of a month, with the Gregorian date in miladi_format."""
+    return tuple(
+        ((year, month, day), f"{day}\n({jdatetime.date(year, month, day).togregorian().strftime(miladi_format)})")
+        for day in range(1, get_days_in_month(year, month) + 1)
+    )
 
-def add_tooltip(widget, text):
-    def on_enter(e):
-        widget.tooltip = tk.Toplevel(widget)
-        widget.tooltip.wm_overrideredirect(True)
-        x = widget.winfo_rootx() + 50
-        y = widget.winfo_rooty() + 10
-        widget.tooltip.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(widget.tooltip, text=text, justify='left', background='lightyellow',
-                         relief='solid', borderwidth=1, font=("Arial", 9))
-        label.pack(ipadx=1)
-    def on_leave(e):
-        if hasattr(widget, 'tooltip'):
-            widget.tooltip.destroy()
-            del widget.tooltip
-    widget.bind("<Enter>", on_enter)
-    widget.bind("<Leave>", on_leave)
+@lru_cache(maxsize=None)
+def _layout(offset, days, base_row):
+    """Grid (row, column) of each day of a month starting in column offset."""
+    return tuple(((offset + d) // 7 + base_row, (offset + d) % 7) for d in range(days))
 
-def show_calendar(year, month):
-    for widget in calendar_frame.winfo_children():
-        widget.destroy()
-    # Create a centered frame to hold the calendar grid
-    centered_frame = tk.Frame(calendar_frame, bg=theme["calendar_bg"])
-    centered_frame.pack(expand=True, anchor="center")
-    
-    month_name = jdatetime.date(year, month, 1).strftime('%B')
-    tk.Label(centered_frame, text=f"{month_name} {year}", font=("Arial", 16), bg=theme["calendar_bg"]).grid(row=0, column=0, columnspan=7)
+@lru_cache(maxsize=None)
+def _month_name(year, month):
+    return jdatetime.date(year, month, 1).strftime('%B')
+
+def add_tooltip(widget, text):
+    widget.tooltip_text = text
+    widget.bindtags(widget.bindtags() + (TOOLTIP_TAG,))
+
+def show_tooltip(e):
+    widget = e.widget
+    tooltip_label.config(text=widget.tooltip_text)
+    tooltip.wm_geometry(f"+{widget.winfo_rootx() + 50}+{widget.winfo_rooty() + 10}")
+    tooltip.deiconify()
+    tooltip.lift()
+
+def hide_tooltip(e=None):
+    tooltip.withdraw()
+
+def show_view(view, **pack_options):
+    """Pack one of the calendar views, hiding the other."""
+    for child in calendar_frame.winfo_children():
+        if child is not view:
+            child.pack_forget()
+    if not view.winfo_manager():
+        view.pack(**pack_options)
+
+def apply_view_theme(view):
+    if view.theme is theme:
+        return
+    for widget in view.bg_widgets:
+        widget.config(bg=theme["calendar_bg"])
+    for widget in view.label_widgets:
+        widget.config(bg=theme["calendar_bg"], fg=theme["label_fg"])
+    view.theme = theme
+
+def make_day_button(parent, width):
+    btn = tk.Button(parent, width=width)
+    btn.config(command=lambda: on_day_click(*btn.day_key))
+    add_tooltip(btn, "")
+    return btn
+
+def update_day_button(btn, key, text):
+    _, bg_color, tooltip_text = day_meta[key]  # the only per-day lookup
+    if key == today_key:
+        btn.config(text=text, bg='red', fg='white')
+    else:
+        btn.config(text=text, bg=bg_color or BUTTON_BG, fg=BUTTON_FG)
+    btn.day_key = key
+    btn.tooltip_text = tooltip_text
+
+def build_month_view():
+    global month_view, month_title
+    month_view = tk.Frame(calendar_frame)
+    month_title = tk.Label(month_view, font=("Arial", 16))
+    month_title.grid(row=0, column=0, columnspan=7)
+    month_view.bg_widgets = [month_view, month_title]
+    month_view.label_widgets = []
+    month_view.theme = None
     weekdays = ['Sat', 'Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri']
     for i, name in enumerate(weekdays):
-        tk.Label(centered_frame, text=name, font=("Arial", 10, "bold"), bg=theme["calendar_bg"]).grid(row=1, column=i)
-    first_weekday = (jdatetime.date(year, month, 1).togregorian().weekday() + 2) % 7
-    row, col = 2, first_weekday
-    for day in range(1, get_days_in_month(year, month) + 1):
-        key = (year, month, day)
-        miladi_str = jdatetime.date(year, month, day).togregorian().strftime('%m/%d')
-        is_today = (year, month, day) == (today_jdate.year, today_jdate.month, today_jdate.day)
-        event_count = len(events.get(key, []))
-        event_colors = [e[1] for e in events.get(key, [])]
-        bg_color = 'red' if is_today else (event_colors[0] if event_colors and event_colors[0] != '#cccccc' else get_event_color(event_count))
-        fg_color = 'white' if is_today else None
-        btn = tk.Button(centered_frame, text=f"{day}\n({miladi_str})", width=6, bg=bg_color, fg=fg_color,
-                        command=lambda d=day: on_day_click(year, month, d))
+        label = tk.Label(month_view, text=name, font=("Arial", 10, "bold"))
+        label.grid(row=1, column=i)
+        month_view.bg_widgets.append(label)
+    month_btn_pool.extend(make_day_button(month_view, 6) for _ in range(31))
+
+def show_calendar(year, month):
+    hide_tooltip()
+    if month_view is None:
+        build_month_view()
+    show_view(month_view, expand=True, anchor="center")
+    apply_view_theme(month_view)
+    month_title.config(text=f"{_month_name(year, month)} {year}")
+    days, offset = year_layout(year)[month - 1]
+    positions = _layout(offset, days, 2)
+    for btn, (key, text), (row, col) in zip(month_btn_pool, _day_cells(year, month, '%m/%d'), positions):
+        update_day_button(btn, key, text)
         btn.grid(row=row, column=col, padx=2, pady=2)
-        tooltip_text = "\n".join(f"{e[0]} (Time: {e[2] or 'N/A'}, Priority: {priority_to_str(e[3])})" for e in events.get(key, [])) or "No events"
-        add_tooltip(btn, tooltip_text)
-        col += 1
-        if col > 6:
-            col, row = 0, row + 1
+    for btn in month_btn_pool[len(positions):]:
+        btn.grid_remove()
 
-def show_full_year_calendar(year):
-    for widget in calendar_frame.winfo_children():
-        widget.destroy()
+def build_year_view():
+    global year_view
     # Create a frame to hold the canvas and scrollbar
-    canvas_frame = tk.Frame(calendar_frame, bg=theme["calendar_bg"])
-    canvas_frame.pack(expand=True, fill="both", padx=10, pady=10)
-    
-    canvas = tk.Canvas(canvas_frame, highlightthickness=0, bg=theme["calendar_bg"])
-    scrollbar = tk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
-    scrollable_frame = tk.Frame(canvas, bg=theme["calendar_bg"])
-    
+    year_view = tk.Frame(calendar_frame)
+    canvas = tk.Canvas(year_view, highlightthickness=0)
+    scrollbar = tk.Scrollbar(year_view, orient="vertical", command=canvas.yview)
+    scrollable_frame = tk.Frame(canvas)
+
     # Bind configure to update scroll region
     scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-    
+
     # Create window in canvas, centered horizontally
     canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
     canvas.configure(yscrollcommand=scrollbar.set)
-    
+
     canvas.pack(side="left", fill="both", expand=True)
     scrollbar.pack(side="right", fill="y")
-    
+
     # Create a frame to hold the grid of months
-    months_frame = tk.Frame(scrollable_frame, bg=theme["calendar_bg"])
+    months_frame = tk.Frame(scrollable_frame)
     months_frame.pack(expand=True, fill="x", padx=20, pady=20)
-    
+
+    year_view.bg_widgets = [year_view, canvas, scrollable_frame, months_frame]
+    year_view.label_widgets = []
+    year_view.theme = None
     for m in range(1, 13):
-        frame = tk.LabelFrame(months_frame, text=jdatetime.date(year, m, 1).strftime('%B'),
-                              padx=5, pady=5,
-                              bg=theme["calendar_bg"],
-                              fg=theme["label_fg"],
-                              font=("Arial", 10))
+        frame = tk.LabelFrame(months_frame, padx=5, pady=5, font=("Arial", 10))
         frame.grid(row=(m - 1) // 3, column=(m - 1) % 3, padx=10, pady=10, sticky="n")
+        year_view.label_widgets.append(frame)
         for i, name in enumerate(['S', 'S', 'M', 'T', 'W', 'T', 'F']):
-            tk.Label(frame, text=name, font=("Arial", 8, "bold"),
-                     width=3, bg=theme["calendar_bg"], fg=theme["label_fg"]).grid(row=0, column=i)
-        first_weekday = (jdatetime.date(year, m, 1).togregorian().weekday() + 2) % 7
-        r, c = 1, first_weekday
-        for day in range(1, get_days_in_month(year, m) + 1):
-            key = (year, m, day)
-            miladi_day = jdatetime.date(year, m, day).togregorian().strftime('%d')
-            label = f"{day}\n({miladi_day})"
-            is_today = (year, m, day) == (today_jdate.year, today_jdate.month, today_jdate.day)
-            event_count = len(events.get(key, []))
-            event_colors = [e[1] for e in events.get(key, [])]
-            bg_color = 'red' if is_today else (event_colors[0] if event_colors and event_colors[0] != '#cccccc' else get_event_color(event_count))
-            fg_color = 'white' if is_today else None
-            btn = tk.Button(frame, text=label, width=4, bg=bg_color, fg=fg_color,
-                            command=lambda y=year, mo=m, d=day: on_day_click(y, mo, d))
+            label = tk.Label(frame, text=name, font=("Arial", 8, "bold"), width=3)
+            label.grid(row=0, column=i)
+            year_view.label_widgets.append(label)
+        year_month_frames.append(frame)
+        year_btn_pool.append([make_day_button(frame, 4) for _ in range(31)])
+
+def show_full_year_calendar(year):
+    hide_tooltip()
+    if year_view is None:
+        build_year_view()
+    show_view(year_view, expand=True, fill="both", padx=10, pady=10)
+    apply_view_theme(year_view)
+    layout = year_layout(year)
+    for m, (frame, buttons) in enumerate(zip(year_month_frames, year_btn_pool), start=1):
+        frame.config(text=_month_name(year, m))
+        days, offset = layout[m - 1]
+        positions = _layout(offset, days, 1)
+        for btn, (key, text), (r, c) in zip(buttons, _day_cells(year, m, '%d'), positions):
+            update_day_button(btn, key, text)
             btn.grid(row=r, column=c)
-            tooltip_text = "\n".join(f"{e[0]} (Time: {e[2] or 'N/A'}, Priority: {priority_to_str(e[3])})" for e in events.get(key, [])) or "No events"
-            add_tooltip(btn, tooltip_text)
-            c += 1
-            if c > 6:
-                c, r = 0, r + 1
+        for btn in buttons[len(positions):]:
+            btn.grid_remove()
 
 def change_month(delta):
+    global pending_redraw
     try:
         y = int(year_entry.get())
         m = int(month_entry.get()) + delta
@@ -344,11 +570,18 @@ def change_month(delta):
         year_entry.insert(0, str(y))
         month_entry.delete(0, tk.END)
         month_entry.insert(0, str(m))
-        set_calendar()
-        save_settings(y, m)
+        # Coalesce key-repeat presses into a single redraw
+        if pending_redraw is not None:
+            root.after_cancel(pending_redraw)
+        pending_redraw = root.after(REDRAW_DELAY_MS, redraw_pending_calendar)
     except ValueError:
         messagebox.showerror("Error", "Please enter valid numbers.")
 
+def redraw_pending_calendar():
+    global pending_redraw
+    pending_redraw = None
+    set_calendar()  # also saves settings
+
 def set_calendar():
     try:
         y, m = int(year_entry.get()), int(month_entry.get())
@@ -382,7 +615,7 @@ def view_day_page(year, month, day):
     day_window.geometry("600x500")  # Increased size for better visibility
     day_window.config(bg=theme["root_bg"])
     key = (year, month, day)
-    day_events = events.get(key, [])
+    day_events = events.setdefault(key, [])  # live list, edited in place
 
     header_label = tk.Label(day_window, text=f"Events for {day}/{month}/{year}", font=("Arial", 16), bg=theme["root_bg"], fg=theme["label_fg"])
     header_label.pack(pady=10)
@@ -403,9 +636,8 @@ def view_day_page(year, month, day):
     # Populate Listbox with events
     def populate_listbox():
         event_listbox.delete(0, tk.END)
-        for event in day_events:
-            display_text = f"{event[0]} (Time: {event[2] or 'N/A'}, Priority: {priority_to_str(event[3])})"
-            event_listbox.insert(tk.END, display_text)
+        if day_events:
+            event_listbox.insert(tk.END, *map(format_event, day_events))
 
     populate_listbox()
 
@@ -440,9 +672,8 @@ def view_day_page(year, month, day):
     def end_drag(event):
         nonlocal drag_index
         if drag_index is not None:
-            # Save the reordered events
-            events[key] = day_events[:]
-            save_events()
+            # Save the reordered events once the user stops reordering
+            mark_dirty(key)
             set_calendar()
             drag_index = None
 
@@ -453,20 +684,16 @@ def view_day_page(year, month, day):
 
     # Sorting functions
     def sort_by_time():
-        nonlocal day_events
         # Sort events: events with time first (chronologically), then events without time
         day_events.sort(key=lambda e: (e[2] == "", e[2] or "25:00"))
-        events[key] = day_events[:]
-        save_events()
+        save_events_incremental(key)
         populate_listbox()
         messagebox.showinfo("Sorted", "Events sorted by time.")
 
     def sort_by_priority():
-        nonlocal day_events
         # Sort events by priority (1=High, 2=Medium, 3=Low)
         day_events.sort(key=lambda e: e[3])
-        events[key] = day_events[:]
-        save_events()
+        save_events_incremental(key)
         populate_listbox()
         messagebox.showinfo("Sorted", "Events sorted by priority.")
 
@@ -474,14 +701,23 @@ def view_day_page(year, month, day):
     day_window.bind("<Control-t>", lambda e: sort_by_time())
     day_window.bind("<Control-p>", lambda e: sort_by_priority())
 
+    no_events_label = tk.Label(day_window, text="No events for this day", bg=theme["root_bg"], fg=theme["label_fg"], font=("Arial", 12))
     if not day_events:
-        no_events_label = tk.Label(day_window, text="No events for this day", bg=theme["root_bg"], fg=theme["label_fg"], font=("Arial", 12))
         no_events_label.pack(pady=20)
 
     # Button frame for sorting and other actions
     button_frame = tk.Frame(day_window, bg=theme["root_bg"])
     button_frame.pack(fill=tk.X, pady=10)
 
+    def refresh_day_page():
+        if not day_window.winfo_exists():
+            return
+        populate_listbox()
+        if day_events:
+            no_events_label.pack_forget()
+        else:
+            no_events_label.pack(pady=20, before=button_frame)
+
     def add_event_button():
         event = simpledialog.askstring("Add Event", f"Enter event for {day}/{month}/{year}:")
         if event:
@@ -493,25 +729,20 @@ def view_day_page(year, month, day):
             if priority is None:
                 return
             color_code = colorchooser.askcolor(title="Pick a color")[1]
-            events.setdefault(key, []).append((event, color_code, time or "", priority))
-            save_events()
-            set_calendar()
-            day_window.destroy()
-            view_day_page(year, month, day)
+            day_events.append((event, color_code, time or "", priority))
+            save_events_incremental(key)
+            refresh_day_page()
+            root.after_idle(set_calendar)
     
     def edit_event_button():
-        edit_events(year, month, day)
-        day_window.destroy()
-        view_day_page(year, month, day)
+        edit_events(year, month, day, on_change=refresh_day_page)
     
     def delete_event_button():
-        key = (year, month, day)
-        day_events = events.get(key, [])
         if day_events:
             choice = messagebox.askyesno("Delete All Events", f"Are you sure you want to delete all events for {day}/{month}/{year}?")
             if choice:
-                events[key] = []
-                save_events()
+                day_events.clear()
+                save_events_incremental(key)
                 day_window.destroy()
                 set_calendar()
                 messagebox.showinfo("Success", f"All events for {day}/{month}/{year} have been deleted.")
@@ -539,8 +770,8 @@ def export_events():
     filepath = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")])
     if filepath:
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump({"-".join(map(str, k)): v for k, v in events.items()}, f, indent=2, ensure_ascii=False)
+            with open(filepath, "wb") as f:
+                f.write(_dumps(events_to_json(events)))
             messagebox.showinfo("Success", "Events exported successfully.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export events: {e}")
@@ -549,20 +780,22 @@ def import_events():
     filepath = filedialog.askopenfilename(filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")])
     if filepath:
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                raw = json.load(f)
+            with open(filepath, "rb") as f:
+                raw = _loads(f.read())
                 imported_events = {}
-                for key, value in raw.items():
-                    imported_events[tuple(map(int, key.split("-")))] = [
+                for key, value in events_from_json(raw).items():
+                    imported_events[key] = [
                         (
                             event[0], 
-                            event[1] if isinstance(event, (list, tuple)) and len(event) > 1 else '#cccccc',
+                            event[1] if isinstance(event, (list, tuple)) and len(event) > 1 else DEFAULT_DAY_COLOR,
                             event[2] if isinstance(event, (list, tuple)) and len(event) > 2 else "",
                             event[3] if isinstance(event, (list, tuple)) and len(event) > 3 else 2
                         )
                         for event in value
                     ]
-                events.update(imported_events)
+                # Replace contents in place; open day pages hold references to these lists
+                for key, day_events in imported_events.items():
+                    events.setdefault(key, [])[:] = day_events
                 save_events()
                 set_calendar()
                 messagebox.showinfo("Success", "Events imported successfully.")
@@ -574,6 +807,17 @@ root = tk.Tk()
 root.title("Shamsi Calendar")
 root.geometry("1000x700")
 
+# One tooltip window shared by every day button; hovering only updates it
+TOOLTIP_TAG = "DayTooltip"
+tooltip = tk.Toplevel(root)
+tooltip.wm_overrideredirect(True)
+tooltip.withdraw()
+tooltip_label = tk.Label(tooltip, justify='left', background='lightyellow',
+                         relief='solid', borderwidth=1, font=("Arial", 9))
+tooltip_label.pack(ipadx=1)
+root.bind_class(TOOLTIP_TAG, "<Enter>", show_tooltip)
+root.bind_class(TOOLTIP_TAG, "<Leave>", hide_tooltip)
+
 # Themes
 light_theme = {
     "root_bg": "#f0f0f0",
@@ -608,6 +852,17 @@ container.pack(expand=True, fill="both")
 calendar_frame = tk.Frame(container, bg=theme["calendar_bg"])
 calendar_frame.pack(expand=True, fill="both")
 
+# Calendar views are built on first use and their widgets reused on every redraw
+month_view = None
+month_title = None
+month_btn_pool = []
+year_view = None
+year_month_frames = []
+year_btn_pool = []
+_probe = tk.Button(root)
+BUTTON_BG, BUTTON_FG = _probe.cget("bg"), _probe.cget("fg")
+_probe.destroy()
+
 top_frame = tk.Frame(container, bg=theme["top_bg"])
 top_frame.pack(pady=10)
 
@@ -644,6 +899,7 @@ file_menu.add_command(label="Export Events", command=export_events)
 file_menu.add_command(label="Delete All Events", command=delete_all_events)
 
 load_events()
+open_events_log()
 last_year, last_month = load_settings()
 if last_year and last_month:
     year_entry.insert(0, str(last_year))
@@ -656,5 +912,6 @@ set_calendar()
 
 root.bind("<Left>", lambda e: change_month(-1))
 root.bind("<Right>", lambda e: change_month(1))
+root.protocol("WM_DELETE_WINDOW", on_close)
 
 root.mainloop()
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""Shamsi calendar arithmetic for the calendar views, compiled with Numba when available."""
+from functools import lru_cache
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+# 1 Farvardin 1403 fell on Wednesday (2024-03-20): column 4 with Saturday as 0
+ANCHOR_YEAR = 1403
+ANCHOR_WEEKDAY = 4
+
+
+@njit(cache=True)
+def jalali_isleap(y):
+    # Same 33-year rule jdatetime uses
+    r = y % 33
+    return r == 1 or r == 5 or r == 9 or r == 13 or r == 17 or r == 22 or r == 26 or r == 30
+
+
+@njit(cache=True)
+def days_in_jmonth(y, m):
+    if m <= 6:
+        return 31
+    if m <= 11:
+        return 30
+    return 30 if jalali_isleap(y) else 29
+
+
+@njit(cache=True)
+def _days_before(y, m):
+    """Days from 1 Farvardin of year 1 to 1 of month m of year y."""
+    n = y - 1
+    leap_days = (n // 33) * 8
+    for r in range(1, n % 33 + 1):
+        if jalali_isleap(r):
+            leap_days += 1
+    month_days = 31 * (m - 1) if m <= 7 else 186 + 30 * (m - 7)
+    return 365 * n + leap_days + month_days
+
+
+_ANCHOR_DAYS = _days_before(ANCHOR_YEAR, 1)
+
+
+@njit(cache=True)
+def first_weekday_jalali(y, m):
+    """Column (0=Sat) of the first day of a Shamsi month."""
+    return (ANCHOR_WEEKDAY + _days_before(y, m) - _ANCHOR_DAYS) % 7
+
+
+if np is not None:
+    @njit(cache=True)
+    def _year_layout(y):
+        out = np.empty((12, 2), np.int32)
+        for m in range(1, 13):
+            out[m - 1, 0] = days_in_jmonth(y, m)
+            out[m - 1, 1] = first_weekday_jalali(y, m)
+        return out
+else:
+    def _year_layout(y):
+        return [(days_in_jmonth(y, m), first_weekday_jalali(y, m)) for m in range(1, 13)]
+
+
+@lru_cache(maxsize=256)
+def year_layout(y):
+    """(days in month, first weekday) for each month of year y, as a tuple of pairs."""
+    return tuple((int(days), int(offset)) for days, offset in _year_layout(y))